@@ -4,6 +4,8 @@
 
 import logging
 import math
+from bisect import bisect_left, bisect_right
+from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
 
@@ -100,6 +102,8 @@ class MarketRole(MarketMechanism, Role):
         self.open_auctions = set()
         self.all_orders = []
         self.results = []
+        # expanded lazily by get_next_opening
+        self._opening_times: tuple[datetime, ...] | None = None
         if marketconfig.price_tick:
             if marketconfig.maximum_bid_price % marketconfig.price_tick != 0:
                 logger.warning(
@@ -212,7 +216,7 @@ class MarketRole(MarketMechanism, Role):
 
     def on_ready(self):
         current = timestamp2datetime(self.context.current_timestamp)
-        next_opening = self.marketconfig.opening_hours.after(current, inc=True)
+        next_opening = self.get_next_opening(current, inc=True)
         opening_ts = datetime2timestamp(next_opening)
         self.context.schedule_timestamp_task(self.opening(), opening_ts)
 
@@ -275,7 +279,7 @@ class MarketRole(MarketMechanism, Role):
         self.context.schedule_timestamp_task(self.clear_market(products), closing_ts)
 
         # schedule the next opening too
-        next_opening = self.marketconfig.opening_hours.after(market_open)
+        next_opening = self.get_next_opening(market_open)
         if next_opening <= self.last_market_opening:
             next_opening_ts = datetime2timestamp(next_opening)
             self.context.schedule_timestamp_task(self.opening(), next_opening_ts)
@@ -288,6 +292,29 @@ class MarketRole(MarketMechanism, Role):
         else:
             logger.debug("market %s - does not reopen", self.marketconfig.market_id)
 
+    def get_next_opening(self, current: datetime, inc: bool = False) -> datetime | None:
+        """
+        Returns the next opening of the market after the given time.
+
+        The opening hours are expanded once and searched with bisection afterwards,
+        as ``rrule.after`` walks all cached occurrences from the start on every call.
+
+        Args:
+            current (datetime.datetime): The time after which the next opening is searched.
+            inc (bool): Whether an opening at exactly the given time is returned as well.
+
+        Returns:
+            datetime.datetime | None: The next opening or None if the market does not open again.
+        """
+        if self._opening_times is None:
+            self._opening_times = tuple(self.marketconfig.opening_hours)
+
+        bisect = bisect_left if inc else bisect_right
+        i = bisect(self._opening_times, current)
+        if i < len(self._opening_times):
+            return self._opening_times[i]
+        return None
+
     def validate_registration(
         self, content: RegistrationMessage, meta: MetaDict
     ) -> bool:
@@ -505,9 +532,8 @@ class MarketRole(MarketMechanism, Role):
             # Validate the order book
             self.validate_orderbook(orderbook, agent_addr)
 
-            # Add each validated order to 'all_orders'
-            for order in orderbook:
-                self.all_orders.append(order)
+            # Add all validated orders to 'all_orders'
+            self.all_orders.extend(orderbook)
 
         except Exception as e:
             # Log the error with agent details for better traceability
@@ -5,8 +5,10 @@
 import asyncio
 import logging
 import random
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime, timedelta
+from functools import partial
 from itertools import groupby
 from operator import itemgetter
 
@@ -85,10 +87,12 @@ class PayAsBidContractRole(MarketRole):
             content (dict): message content with data property
             meta (MetaDict): message meta
         """
-        if meta["in_reply_to"] not in self.futures:
+        # resolved futures are removed so that they do not pile up over the simulation
+        future = self.futures.pop(meta["in_reply_to"], None)
+        if future is None:
             logger.debug("data response %s not in awaited futures", meta["in_reply_to"])
         else:
-            self.futures[meta["in_reply_to"]].set_result(content["data"])
+            future.set_result(content["data"])
 
     def validate_orderbook(
         self, orderbook: Orderbook, agent_addr: AgentAddress
@@ -130,11 +134,13 @@ class PayAsBidContractRole(MarketRole):
         accepted_orders: Orderbook = []
         rejected_orders: Orderbook = []
         meta = []
+        # set lookup instead of scanning the product list for each product group
+        product_set = set(market_products)
         orderbook.sort(key=market_getter)
         for product, product_orders in groupby(orderbook, market_getter):
             accepted_demand_orders: Orderbook = []
             accepted_supply_orders: Orderbook = []
-            if product[0:3] not in market_products:
+            if product[0:3] not in product_set:
                 rejected_orders.extend(product_orders)
                 # logger.debug(f'found unwanted bids for {product} should be {market_products}')
                 continue
@@ -147,6 +153,8 @@ class PayAsBidContractRole(MarketRole):
 
             # Sort supply orders by price with randomness for tie-breaking
             supply_orders.sort(key=lambda i: (i["price"], random.random()))
+            # deque allows popping and re-inserting at the head in constant time
+            supply_orders = deque(supply_orders)
             # Sort demand orders by price in descending order with randomness for tie-breaking
             demand_orders.sort(
                 key=lambda i: (i["price"], random.random()), reverse=True
@@ -164,7 +172,7 @@ class PayAsBidContractRole(MarketRole):
                 to_commit: Orderbook = []
 
                 while supply_orders and gen_vol < dem_vol:
-                    supply_order = supply_orders.pop(0)
+                    supply_order = supply_orders.popleft()
                     if supply_order["price"] <= demand_order["price"]:
                         supply_order["accepted_volume"] = supply_order["volume"]
                         to_commit.append(supply_order)
@@ -184,8 +192,6 @@ class PayAsBidContractRole(MarketRole):
                 elif diff > 0:
                     # generation left over - accept generation bid partially
                     supply_order = to_commit[-1]
-                    split_supply_order = supply_order.copy()
-                    split_supply_order["volume"] = diff
                     supply_order["accepted_volume"] = supply_order["volume"] - diff
 
                     # changed supply_order is still part of to_commit and will be added
@@ -193,7 +199,7 @@ class PayAsBidContractRole(MarketRole):
                     gen_vol -= diff
 
                     # add left over to supply_orders again
-                    supply_orders.insert(0, supply_order)
+                    supply_orders.appendleft(supply_order)
                     demand_order["accepted_volume"] = demand_order["volume"]
                 else:
                     demand_order["accepted_volume"] = demand_order["volume"]
@@ -251,8 +257,6 @@ class PayAsBidContractRole(MarketRole):
             # demand for contracts is maximum generation capacity of the buyer
             # this is needed so that the seller of the contract can lower the volume
 
-            from functools import partial
-
             for order in accepted_supply_orders:
                 recurrency_task = rr.rrule(
                     freq=order["evaluation_frequency"],
@@ -297,7 +301,7 @@ class PayAsBidContractRole(MarketRole):
         end -= timedelta(hours=1)
 
         reply_with = f'{buyer}_{contract["start_time"]}'
-        self.futures[reply_with] = asyncio.Future()
+        client_future = self.futures[reply_with] = asyncio.Future()
         self.context.schedule_instant_message(
             create_acl(
                 {
@@ -319,7 +323,7 @@ class PayAsBidContractRole(MarketRole):
 
         if contract["contract"] in contract_needs_market:
             reply_with_market = f'market_eom_{contract["start_time"]}'
-            self.futures[reply_with_market] = asyncio.Future()
+            market_future = self.futures[reply_with_market] = asyncio.Future()
             self.context.schedule_instant_message(
                 create_acl(
                     {
@@ -342,11 +346,11 @@ class PayAsBidContractRole(MarketRole):
                 ),
                 receiver_addr=self.context.addr,
             )
-            market_series = await self.futures[reply_with_market]
+            market_series = await market_future
         else:
             market_series = None
 
-        client_series = await self.futures[reply_with]
+        client_series = await client_future
         o_buyer, o_seller = c_function(
             contract, market_series, client_series, begin, end
         )
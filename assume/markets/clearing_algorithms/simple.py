@@ -4,6 +4,7 @@
 
 import logging
 import random
+from collections import deque
 from datetime import timedelta
 from itertools import groupby
 from operator import itemgetter
@@ -22,11 +23,11 @@ def calculate_meta(accepted_supply_orders, accepted_demand_orders, product):
     duration_hours = (product[1] - product[0]) / timedelta(hours=1)
     avg_price = 0
     if supply_volume:
-        weighted_price = [
+        weighted_price = sum(
             order["accepted_volume"] * order["accepted_price"]
             for order in accepted_supply_orders
-        ]
-        avg_price = sum(weighted_price) / supply_volume
+        )
+        avg_price = weighted_price / supply_volume
     return {
         "supply_volume": supply_volume,
         "demand_volume": demand_volume,
@@ -65,13 +66,15 @@ class PayAsClearRole(MarketRole):
         rejected_orders: Orderbook = []
         clear_price = 0
         meta = []
+        # set lookup instead of scanning the product list for each product group
+        product_set = set(market_products)
         orderbook.sort(key=market_getter)
         for product, product_orders in groupby(orderbook, market_getter):
             accepted_demand_orders: Orderbook = []
             accepted_supply_orders: Orderbook = []
             rejected_product_orders: Orderbook = []
             product_orders = list(product_orders)
-            if product not in market_products:
+            if product not in product_set:
                 rejected_product_orders.extend(product_orders)
                 # logger.debug(f'found unwanted bids for {product} should be {market_products}')
                 continue
@@ -82,6 +85,8 @@ class PayAsClearRole(MarketRole):
 
             # Sort supply orders by price with randomness for tie-breaking
             supply_orders.sort(key=lambda x: (x["price"], random.random()))
+            # deque allows popping and re-inserting at the head in constant time
+            supply_orders = deque(supply_orders)
 
             # Sort demand orders by price in descending order with randomness for tie-breaking
             demand_orders.sort(
@@ -104,7 +109,7 @@ class PayAsClearRole(MarketRole):
                 demand_order["accepted_volume"] = demand_order["volume"]
                 # and add supply until the demand order is matched
                 while supply_orders and gen_vol < dem_vol:
-                    supply_order = supply_orders.pop(0)
+                    supply_order = supply_orders.popleft()
                     if supply_order["price"] <= demand_order["price"]:
                         added = supply_order["volume"] - supply_order.get(
                             "accepted_volume", 0
@@ -136,7 +141,7 @@ class PayAsClearRole(MarketRole):
                     gen_vol -= diff
 
                     # add left over to supply_orders again
-                    supply_orders.insert(0, supply_order)
+                    supply_orders.appendleft(supply_order)
                     demand_order["accepted_volume"] = demand_order["volume"]
                 else:
                     demand_order["accepted_volume"] = demand_order["volume"]
@@ -146,12 +151,11 @@ class PayAsClearRole(MarketRole):
 
             # if demand is fulfilled, we do have some additional supply orders
             # these will be rejected
+            # compare by identity, scanning the list of order dicts is quadratic
+            rejected_ids = set(map(id, rejected_product_orders))
             for order in product_orders:
                 # if the order was not accepted partially, it is rejected
-                if (
-                    not order.get("accepted_volume")
-                    and order not in rejected_product_orders
-                ):
+                if not order.get("accepted_volume") and id(order) not in rejected_ids:
                     rejected_product_orders.append(order)
 
             # set clearing price - merit order - uniform pricing
@@ -209,22 +213,28 @@ class PayAsBidRole(MarketRole):
         accepted_orders: Orderbook = []
         rejected_orders: Orderbook = []
         meta = []
+        # set lookup instead of scanning the product list for each product group
+        product_set = set(market_products)
         orderbook.sort(key=market_getter)
         for product, product_orders in groupby(orderbook, market_getter):
             accepted_demand_orders: Orderbook = []
             accepted_supply_orders: Orderbook = []
-            if product not in market_products:
+            if product not in product_set:
                 rejected_orders.extend(product_orders)
                 # logger.debug(f'found unwanted bids for {product} should be {market_products}')
                 continue
 
             product_orders = list(product_orders)
+            # orders of this product which are rejected are appended from here on
+            rejected_start = len(rejected_orders)
             supply_orders = [x for x in product_orders if x["volume"] > 0]
             demand_orders = [x for x in product_orders if x["volume"] < 0]
             # volume 0 is ignored/invalid
 
             # Sort supply orders by price with randomness for tie-breaking
             supply_orders.sort(key=lambda i: (i["price"], random.random()))
+            # deque allows popping and re-inserting at the head in constant time
+            supply_orders = deque(supply_orders)
             # Sort demand orders by price in descending order with randomness for tie-breaking
             demand_orders.sort(
                 key=lambda i: (i["price"], random.random()), reverse=True
@@ -244,7 +254,7 @@ class PayAsBidRole(MarketRole):
                 to_commit: Orderbook = []
 
                 while supply_orders and gen_vol < dem_vol:
-                    supply_order = supply_orders.pop(0)
+                    supply_order = supply_orders.popleft()
                     if supply_order["price"] <= demand_order["price"]:
                         supply_order["accepted_volume"] = supply_order["volume"]
                         to_commit.append(supply_order)
@@ -270,7 +280,7 @@ class PayAsBidRole(MarketRole):
                     # add left over to supply_orders again
                     gen_vol -= diff
 
-                    supply_orders.insert(0, split_supply_order)
+                    supply_orders.appendleft(split_supply_order)
                     demand_order["accepted_volume"] = demand_order["volume"]
                 else:
                     # diff == 0 perfect match
@@ -287,9 +297,11 @@ class PayAsBidRole(MarketRole):
 
             # if demand is fulfilled, we do have some additional supply orders
             # these will be rejected
+            # compare by identity, scanning the list of order dicts is quadratic
+            rejected_ids = set(map(id, rejected_orders[rejected_start:]))
             for order in product_orders:
                 # if the order was not accepted partially, it is rejected
-                if not order.get("accepted_volume") and order not in rejected_orders:
+                if not order.get("accepted_volume") and id(order) not in rejected_ids:
                     rejected_orders.append(order)
 
             accepted_product_orders = accepted_demand_orders + accepted_supply_orders
@@ -291,3 +291,15 @@ async def test_market_accepted(market_role: MarketRole):
 
     accepted, meta = await market_role.clear_market([(start, end, None)])
     assert accepted == orderbook
+
+
+async def test_market_next_opening(market_role: MarketRole):
+    opening_hours = market_role.marketconfig.opening_hours
+    for current in [start, start + rd(minutes=30), datetime(2020, 6, 1, 12)]:
+        assert market_role.get_next_opening(current) == opening_hours.after(current)
+        assert market_role.get_next_opening(current, inc=True) == opening_hours.after(
+            current, inc=True
+        )
+
+    assert market_role.get_next_opening(end) is None
+    assert market_role.get_next_opening(end, inc=True) == end
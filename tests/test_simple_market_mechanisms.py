@@ -9,7 +9,11 @@ from dateutil import rrule as rr
 
 from assume.common.market_objects import MarketConfig, MarketProduct
 from assume.common.utils import get_available_products
-from assume.markets.clearing_algorithms import PayAsClearRole, clearing_mechanisms
+from assume.markets.clearing_algorithms import (
+    PayAsBidRole,
+    PayAsClearRole,
+    clearing_mechanisms,
+)
 
 from .utils import create_orderbook, extend_orderbook
 
@@ -193,3 +197,34 @@ def test_market_pay_as_clears_single_demand_more_generation():
     assert meta[0]["price"] == 60
     assert accepted[0]["volume"] == -400
     assert accepted[0]["accepted_volume"] == -400
+
+
+def test_market_rejects_identical_orders():
+    next_opening = simple_dayahead_auction_config.opening_hours.after(
+        datetime(2005, 6, 1)
+    )
+    products = get_available_products(
+        simple_dayahead_auction_config.market_products, next_opening
+    )
+
+    for role in [PayAsClearRole, PayAsBidRole]:
+        """
+        Create Orderbook with two identical supply orders which are not matched:
+            - dem1: volume = -400, price = 100
+            - gen1: volume = 400, price = 50
+            - gen2, gen3: volume = 300, price = 200
+        """
+        orderbook = extend_orderbook(products, -400, 100)
+        orderbook = extend_orderbook(products, 400, 50, orderbook)
+        orderbook = extend_orderbook(products, 300, 200, orderbook)
+        # a distinct order dict which is equal to the previous one
+        orderbook.append(orderbook[-1].copy())
+
+        mr = role(simple_dayahead_auction_config)
+        accepted, rejected, meta, flows = mr.clear(orderbook, products)
+        assert len(accepted) == 2
+        assert len(rejected) == 2
+        assert rejected[0] is not rejected[1]
+        for bid in rejected:
+            assert bid["volume"] == 300
+            assert bid["accepted_volume"] == 0